@@ -0,0 +1,39 @@
+"""Shared naming rules for skill-master scripts.
+
+agentskills.io names (and the Copilot topics/roles scaffolded alongside
+them) are lower-kebab-case: a-z0-9 plus single hyphens, no leading or
+trailing hyphen.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import Final
+
+
+# Anchored at both ends, so .match() is enough.
+KEBAB_RE: Final = re.compile(r"[a-z0-9]+(?:-[a-z0-9]+)*\Z")
+
+
+def is_kebab(name: str) -> bool:
+    """Return True if name is lower-kebab-case."""
+    # Cheap rejects for the usual malformed input (non-ASCII, stray or
+    # doubled hyphens), then a cheap accept for the well-formed case; only
+    # what is left goes to the regex.
+    if not name.isascii() or name.startswith("-") or name.endswith("-") or "--" in name:
+        return False
+    stripped = name.replace("-", "")
+    if stripped.isalnum() and (name.islower() or stripped.isdigit()):
+        return True
+    return KEBAB_RE.match(name) is not None
+
+
+def validate_kebab(name: str, label: str, maxlen: int = 64) -> None:
+    """Raise ValueError unless name is 1..maxlen chars of lower-kebab-case."""
+    if len(name) < 1 or len(name) > maxlen:
+        raise ValueError(f"{label} must be 1-{maxlen} characters (got {len(name)})")
+    if not is_kebab(name):
+        raise ValueError(
+            f"{label} must be lowercase a-z0-9 plus single hyphens "
+            "(no --, no leading/trailing -)"
+        )
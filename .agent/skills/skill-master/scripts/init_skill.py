@@ -14,61 +14,73 @@ Examples:
 
 from __future__ import annotations
 
-import argparse
-import re
+import os
 import sys
 from pathlib import Path
-
-
-# agentskills.io spec: lowercase alphanumeric + hyphens, no consecutive hyphens
-_SKILL_NAME_RE = re.compile(r"^[a-z0-9]+(?:-[a-z0-9]+)*$")
-
-
-def _script_dir() -> Path:
-    return Path(__file__).resolve().parent
-
-
-def _find_repo_root(start: Path) -> Path:
-    """Walk up until we find a .git directory or reach filesystem root."""
-    current = start.resolve()
-    while current != current.parent:
-        if (current / ".git").exists():
-            return current
-        current = current.parent
-    # Fallback: 4 levels up from script location
-    return _script_dir().parents[3]
-
-
-def _ensure_parent_dir(path: Path) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-
-
-def _write_file_if_missing(path: Path, content: str) -> None:
-    if path.exists():
-        raise FileExistsError(f"File already exists: {path}")
-    _ensure_parent_dir(path)
-    path.write_text(content, encoding="utf-8")
-
-
-def _mkdir_if_missing(path: Path) -> None:
-    if path.exists():
-        raise FileExistsError(f"Path already exists: {path}")
-    path.mkdir(parents=True, exist_ok=False)
-
-
-def _title_from_kebab(name: str) -> str:
-    return " ".join(part.capitalize() for part in name.split("-"))
+from typing import Final
+
+try:
+    from _common import (
+        ERROR,
+        OK,
+        emit,
+        mkdir_if_missing,
+        title_from_kebab,
+        write_file_if_missing,
+    )
+    from _naming import validate_kebab
+except ModuleNotFoundError:
+    _SCRIPT_DIR = Path(__file__).resolve().parent
+    sys.path.insert(0, _SCRIPT_DIR.as_posix())
+    from _common import (
+        ERROR,
+        OK,
+        emit,
+        mkdir_if_missing,
+        title_from_kebab,
+        write_file_if_missing,
+    )
+    from _naming import validate_kebab
+
+
+# Template follows agentskills.io specification
+# https://agentskills.io/specification
+# Templates are pre-encoded around their variable slots so only the slot
+# values need encoding per call.
+_SKILL_HEAD: Final = b"---\nname: "
+_SKILL_MID: Final = (
+    b"\n"
+    b"description: \"[TODO] Describe what this skill does and when to use it. Include discovery keywords.\"\n"
+    b"---\n\n"
+    b"# "
+)
+_SKILL_TAIL: Final = (
+    b"\n\n"
+    b"## When to Use\n\n"
+    b"- [TODO] Situations and triggers\n\n"
+    b"## Quick Navigation\n\n"
+    b"- Topic A: `references/topic-a.md`\n\n"
+    b"## Steps / Recipes\n\n"
+    b"1. [TODO]\n\n"
+    b"## Critical Prohibitions\n\n"
+    b"- [TODO]\n\n"
+    b"## Links\n\n"
+    b"- [TODO] External references\n"
+)
+
+_README_HEAD: Final = b"# "
+_README_TAIL: Final = (
+    "\n\n"
+    "[TODO] Brief description for human readers.\n\n"
+    "## Quick Navigation\n\n"
+    "- [SKILL.md](SKILL.md) — Entry point for agents\n"
+    "- [references/](references/) — Detailed documentation\n"
+).encode("utf-8")
 
 
 def _validate_skill_name(name: str) -> None:
     """Validate skill name per agentskills.io specification."""
-    if len(name) < 1 or len(name) > 64:
-        raise ValueError("skill-name must be 1-64 characters")
-    if not _SKILL_NAME_RE.fullmatch(name):
-        raise ValueError(
-            "skill-name must be lowercase a-z0-9 plus single hyphens "
-            "(no --, no leading/trailing -)"
-        )
+    validate_kebab(name, "skill-name")
 
 
 def init_skill(skill_name: str, skills_root: Path) -> Path:
@@ -83,53 +95,31 @@ def init_skill(skill_name: str, skills_root: Path) -> Path:
     """
     _validate_skill_name(skill_name)
 
-    skill_dir = skills_root / skill_name
-    _mkdir_if_missing(skill_dir)
-
-    skill_md = skill_dir / "SKILL.md"
-    title = _title_from_kebab(skill_name)
-
-    # Template follows agentskills.io specification
-    # https://agentskills.io/specification
-    content = (
-        "---\n"
-        f"name: {skill_name}\n"
-        "description: \"[TODO] Describe what this skill does and when to use it. Include discovery keywords.\"\n"
-        "---\n\n"
-        f"# {title}\n\n"
-        "## When to Use\n\n"
-        "- [TODO] Situations and triggers\n\n"
-        "## Quick Navigation\n\n"
-        "- Topic A: `references/topic-a.md`\n\n"
-        "## Steps / Recipes\n\n"
-        "1. [TODO]\n\n"
-        "## Critical Prohibitions\n\n"
-        "- [TODO]\n\n"
-        "## Links\n\n"
-        "- [TODO] External references\n"
-    )
+    skill_dir = f"{skills_root}/{skill_name}"
+    mkdir_if_missing(skill_dir)
 
-    _write_file_if_missing(skill_md, content)
+    skill_md = f"{skill_dir}/SKILL.md"
+    title = title_from_kebab(skill_name).encode("utf-8")
+
+    write_file_if_missing(
+        skill_md, _SKILL_HEAD, skill_name.encode("utf-8"), _SKILL_MID, title, _SKILL_TAIL
+    )
 
     # Create references directory per agentskills.io progressive disclosure pattern
-    (skill_dir / "references").mkdir(exist_ok=True)
+    os.makedirs(f"{skill_dir}/references", exist_ok=True)
 
     # Create README.md for human readers
-    readme_content = (
-        f"# {title}\n\n"
-        "[TODO] Brief description for human readers.\n\n"
-        "## Quick Navigation\n\n"
-        "- [SKILL.md](SKILL.md) — Entry point for agents\n"
-        "- [references/](references/) — Detailed documentation\n"
-    )
-    readme_path = skill_dir / "README.md"
-    if not readme_path.exists():
-        readme_path.write_text(readme_content, encoding="utf-8")
+    try:
+        write_file_if_missing(f"{skill_dir}/README.md", _README_HEAD, title, _README_TAIL)
+    except FileExistsError:
+        pass
 
-    return skill_dir
+    return Path(skill_dir)
 
 
 def main(argv: list[str] | None = None) -> int:
+    import argparse
+
     parser = argparse.ArgumentParser(
         prog="init_skill.py",
         description="Initialize Agent Skill per agentskills.io specification",
@@ -158,10 +148,10 @@ def main(argv: list[str] | None = None) -> int:
 
     try:
         created = init_skill(args.skill_name, skills_root)
-        print(f"✅ Created skill: {created}")
+        emit(sys.stdout, OK, f"Created skill: {created}")
         return 0
     except Exception as exc:
-        print(f"❌ {exc}", file=sys.stderr)
+        emit(sys.stderr, ERROR, str(exc))
         return 1
 
 
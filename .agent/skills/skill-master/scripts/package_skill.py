@@ -7,6 +7,9 @@ Behavior:
 - Validates the skill directory using quick_validate_skill.py
 - Creates a zip in the specified output directory (default: ./dist)
 - Zip root contains the skill folder itself (e.g., skill-master/SKILL.md ...)
+- Inside a git work tree, packages the files git knows about (tracked plus
+  untracked-but-not-ignored); otherwise walks the directory
+- Skips symlinks, .DS_Store, and VCS/dependency/cache directories (.git, node_modules, ...)
 
 Usage:
     python package_skill.py <skill-directory> [--out dist]
@@ -14,68 +17,239 @@ Usage:
 
 from __future__ import annotations
 
-import argparse
+import os
+import shutil
+import stat
+import subprocess
 import sys
-from datetime import datetime
+import time
 import zipfile
+from collections.abc import Iterator
 from pathlib import Path
+from typing import Final
 
 try:
+    from _common import OK, WARN, emit
     from quick_validate_skill import validate_skill_dir
 except ModuleNotFoundError:
     _SCRIPT_DIR = Path(__file__).resolve().parent
     sys.path.insert(0, _SCRIPT_DIR.as_posix())
+    from _common import OK, WARN, emit
     from quick_validate_skill import validate_skill_dir
 
 
-def _iter_files(skill_dir: Path) -> list[Path]:
-    skill_dir_resolved = skill_dir.resolve()
-    files: list[Path] = []
-    for path in skill_dir.rglob("*"):
-        if path.is_dir():
+# VCS metadata, dependency trees and tool caches are never part of a skill;
+# these directories are not descended into at all.
+_PRUNE_DIRS: Final = frozenset(
+    {".git", "node_modules", "__pycache__", ".venv", ".mypy_cache", ".pytest_cache"}
+)
+
+
+# Already-compressed formats gain nothing from deflate.
+_STORED_SUFFIXES: Final = (
+    ".png", ".jpg", ".jpeg", ".gif", ".webp", ".woff", ".woff2", ".zip", ".gz"
+)
+
+# Files above this size are streamed into the archive instead of read whole.
+_STREAM_THRESHOLD: Final = 1 << 20
+
+
+def _add_file(
+    zf: zipfile.ZipFile, file_path: str, arcname: str, exclude: tuple[int, int]
+) -> None:
+    """Write one file into zf, opening it once and picking its compression.
+
+    A file whose (st_dev, st_ino) equals exclude is skipped; main passes
+    the archive's own identity so it never packs itself.
+    """
+    if file_path.lower().endswith(_STORED_SUFFIXES):
+        compress_type = zipfile.ZIP_STORED
+    else:
+        compress_type = zipfile.ZIP_DEFLATED
+
+    with open(file_path, "rb") as fh:
+        st = os.fstat(fh.fileno())
+        if (st.st_dev, st.st_ino) == exclude:
+            return
+        date_time = time.localtime(st.st_mtime)[:6]
+        if date_time[0] < 1980:
+            date_time = (1980, 1, 1, 0, 0, 0)
+        info = zipfile.ZipInfo(arcname, date_time)
+        info.external_attr = (st.st_mode & 0xFFFF) << 16
+        info.compress_type = compress_type
+
+        if st.st_size > _STREAM_THRESHOLD:
+            info.file_size = st.st_size
+            with zf.open(info, "w") as dst:
+                shutil.copyfileobj(fh, dst)
+        else:
+            zf.writestr(info, fh.read())
+
+
+def _has_entries(dir_path: str) -> bool:
+    try:
+        with os.scandir(dir_path) as entries:
+            return next(entries, None) is not None
+    except OSError:
+        # Unreadable: it is skipped either way, so report it rather than fail.
+        return True
+
+
+def _iter_files(
+    skill_dir: Path, pruned: list[str] | None = None
+) -> Iterator[tuple[str, str]]:
+    """Yield (path, relative posix path) for each regular file in skill_dir.
+
+    Symlinks are never followed or packaged, so nothing outside the tree
+    can end up in the archive. Directories in _PRUNE_DIRS and unreadable
+    directories are skipped; non-empty pruned ones and unreadable ones are
+    appended to pruned (as relative paths) if given.
+    """
+    stack = [(os.fspath(skill_dir), "")]
+    while stack:
+        dir_path, rel_prefix = stack.pop()
+        try:
+            entries = os.scandir(dir_path)
+        except OSError:
+            # Unreadable directory: skipped (as Path.rglob did), but reported.
+            if pruned is not None:
+                pruned.append(rel_prefix.rstrip("/") or ".")
             continue
-        if path.is_symlink():
+        with entries:
+            for entry in entries:
+                # Only a symlink can point outside skill_dir. Skipping them
+                # (rather than resolving every entry and checking it stays
+                # under the root) is the whole escape guard.
+                if entry.is_symlink():
+                    continue
+                if entry.name == ".DS_Store":
+                    continue
+
+                rel = rel_prefix + entry.name
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name in _PRUNE_DIRS:
+                        if pruned is not None and _has_entries(entry.path):
+                            pruned.append(rel)
+                        continue
+                    stack.append((entry.path, rel + "/"))
+                elif entry.is_file(follow_symlinks=False):
+                    yield entry.path, rel
+
+
+def _git_ls_files(skill_dir: Path) -> list[str] | None:
+    """Return skill_dir's files as git sees them, or None if git can't tell.
+
+    Lists tracked files plus untracked ones that .gitignore does not
+    exclude, relative to skill_dir. Returns None so the caller can fall
+    back to walking when git fails (not a repo, git not installed) or the
+    listing lacks SKILL.md (e.g. the skill sits in an ignored directory).
+    """
+    try:
+        proc = subprocess.run(
+            [
+                "git",
+                "-C",
+                os.fspath(skill_dir),
+                "ls-files",
+                "-z",
+                "--cached",
+                "--others",
+                "--exclude-standard",
+            ],
+            capture_output=True,
+            check=False,
+        )
+    except OSError:
+        return None
+    if proc.returncode != 0:
+        return None
+
+    # Unmerged paths can be listed once per stage.
+    rels = list(dict.fromkeys(os.fsdecode(p) for p in proc.stdout.split(b"\0") if p))
+    if "SKILL.md" not in rels:
+        return None
+    return rels
+
+
+def _iter_listed_files(
+    skill_dir: Path, rels: list[str], pruned: list[str] | None = None
+) -> Iterator[tuple[str, str]]:
+    """Yield (path, relative posix path) for listed entries that _iter_files would keep.
+
+    Like _iter_files, each pruned directory that held a listed file is
+    appended to pruned (once, as a relative path) if given.
+    """
+    root = os.fspath(skill_dir)
+    seen_pruned: set[str] = set()
+    for rel in rels:
+        parts = rel.split("/")
+        if parts[-1] == ".DS_Store":
             continue
-        if path.name == ".DS_Store":
+        if not _PRUNE_DIRS.isdisjoint(parts[:-1]):
+            if pruned is not None:
+                depth = next(i for i, part in enumerate(parts) if part in _PRUNE_DIRS)
+                pruned_rel = "/".join(parts[: depth + 1])
+                if pruned_rel not in seen_pruned:
+                    seen_pruned.add(pruned_rel)
+                    pruned.append(pruned_rel)
             continue
 
-        resolved = path.resolve()
+        path = os.path.join(root, rel)
         try:
-            resolved.relative_to(skill_dir_resolved)
-        except ValueError:
+            mode = os.lstat(path).st_mode
+        except FileNotFoundError:
+            # Deleted in the work tree but still in the index.
             continue
-
-        files.append(path)
-    return files
+        # Skips symlinks, and submodules / nested repos listed as directories.
+        if stat.S_ISREG(mode):
+            yield path, rel
 
 
 def main() -> int:
+    import argparse
+
     parser = argparse.ArgumentParser()
     parser.add_argument("skill_dir", type=Path)
     parser.add_argument("--out", dest="out_dir", type=Path, default=Path("dist"))
     args = parser.parse_args()
 
-    skill_dir = args.skill_dir.resolve()
-    validate_skill_dir(skill_dir)
+    # abspath is string work plus one getcwd; resolve() would lstat every
+    # component. Only a symlinked skill dir needs resolving, for its name.
+    skill_dir = Path(os.path.abspath(args.skill_dir))
+    if os.path.islink(skill_dir):
+        skill_dir = skill_dir.resolve()
+    meta = validate_skill_dir(skill_dir)
 
-    out_dir = args.out_dir.resolve()
+    out_dir = Path(os.path.abspath(args.out_dir))
     out_dir.mkdir(parents=True, exist_ok=True)
 
-    zip_path = out_dir / f"{skill_dir.name}.zip"
+    zip_path = out_dir / f"{meta.name}.zip"
     if zip_path.exists():
         raise FileExistsError(
             f"Refusing to overwrite existing archive: {zip_path}. "
             "Delete it or choose a different --out directory."
         )
 
-    files = _iter_files(skill_dir)
+    pruned: list[str] = []
+    rels = _git_ls_files(skill_dir)
+    if rels is None:
+        files = _iter_files(skill_dir, pruned)
+    else:
+        files = _iter_listed_files(skill_dir, rels, pruned)
 
     with zipfile.ZipFile(zip_path, "w", compression=zipfile.ZIP_DEFLATED) as zf:
-        for file_path in files:
-            arcname = Path(skill_dir.name) / file_path.relative_to(skill_dir)
-            zf.write(file_path, arcname.as_posix())
+        # The archive is written while walking and --out may point inside
+        # the skill directory, possibly through a symlink. Compare file
+        # identity, not path strings, so it is never picked up as input.
+        zip_st = os.fstat(zf.fp.fileno())
+        zip_id = (zip_st.st_dev, zip_st.st_ino)
+        for file_path, rel in files:
+            _add_file(zf, file_path, f"{meta.name}/{rel}", zip_id)
+
+    for rel in pruned:
+        emit(sys.stderr, WARN, f"Skipped directory: {rel}/")
 
-    print(f"✅ Packaged: {zip_path}")
+    emit(sys.stdout, OK, f"Packaged: {zip_path}")
     return 0
 
 
@@ -0,0 +1,110 @@
+"""Filesystem, naming and output helpers shared by the skill-master scripts."""
+
+from __future__ import annotations
+
+import functools
+import os
+from pathlib import Path
+from typing import Final, TextIO
+
+
+_REPO_ROOT_CACHE: Final[dict[str, Path | None]] = {}
+
+_CREATE_FLAGS: Final = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0)
+
+
+def find_repo_root(start: Path) -> Path | None:
+    """Walk up until we find a .git entry; None at a filesystem boundary.
+
+    A ``.git`` file (worktrees, submodules) counts as well as a directory.
+    Results are cached per start directory for the life of the process.
+    """
+    key = os.path.abspath(start)
+    if key in _REPO_ROOT_CACHE:
+        return _REPO_ROOT_CACHE[key]
+
+    root: Path | None = None
+    current = key
+    try:
+        device = os.stat(current).st_dev
+    except OSError:
+        device = None
+    while device is not None:
+        try:
+            os.lstat(os.path.join(current, ".git"))
+        except OSError:
+            pass
+        else:
+            root = Path(current)
+            break
+        parent = os.path.dirname(current)
+        if parent == current:
+            break
+        try:
+            if os.stat(parent).st_dev != device:
+                break
+        except OSError:
+            break
+        current = parent
+
+    _REPO_ROOT_CACHE[key] = root
+    return root
+
+
+def ensure_parent_dir(path: str) -> None:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+
+
+def write_file_if_missing(path: str, *chunks: bytes) -> None:
+    """Create path with the concatenated chunks; fail if it already exists."""
+    # O_EXCL makes the kernel report an existing file atomically; parents
+    # are only created when the first attempt says they are missing.
+    try:
+        try:
+            fd = os.open(path, _CREATE_FLAGS, 0o644)
+        except FileNotFoundError:
+            ensure_parent_dir(path)
+            fd = os.open(path, _CREATE_FLAGS, 0o644)
+    except FileExistsError:
+        raise FileExistsError(f"File already exists: {path}") from None
+
+    try:
+        data = memoryview(b"".join(chunks))
+        while data:
+            data = data[os.write(fd, data):]
+    finally:
+        os.close(fd)
+
+
+def mkdir_if_missing(path: str) -> None:
+    try:
+        os.makedirs(path)
+    except FileExistsError:
+        raise FileExistsError(f"Path already exists: {path}") from None
+
+
+@functools.lru_cache(maxsize=128)
+def title_from_kebab(name: str) -> str:
+    return " ".join(part.capitalize() for part in name.split("-"))
+
+
+# Status line prefixes, encoded once.
+OK: Final = "✅ ".encode("utf-8")
+WARN: Final = "⚠️ ".encode("utf-8")
+ERROR: Final = "❌ ".encode("utf-8")
+
+
+def emit(stream: TextIO, prefix: bytes, text: str) -> None:
+    """Write prefix + text + newline to stream as UTF-8.
+
+    Goes straight to the byte buffer when the stream is UTF-8, skipping
+    print()'s formatting and re-encoding; otherwise (replaced streams,
+    non-UTF-8 consoles) falls back to a text write.
+    """
+    buffer = getattr(stream, "buffer", None)
+    encoding = (getattr(stream, "encoding", None) or "").lower().replace("-", "")
+    if buffer is None or encoding != "utf8":
+        stream.write(prefix.decode("utf-8") + text + "\n")
+        return
+    stream.flush()
+    buffer.write(prefix + os.fsencode(text) + b"\n")
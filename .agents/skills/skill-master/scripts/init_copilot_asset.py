@@ -18,59 +18,77 @@ Examples:
 
 from __future__ import annotations
 
-import argparse
-import re
 import sys
 from pathlib import Path
-
-
-_INSTRUCTION_TOPIC_RE = re.compile(r"^[a-z0-9]+(?:-[a-z0-9]+)*$")
-_AGENT_ROLE_RE = re.compile(r"^[a-z0-9]+(?:-[a-z0-9]+)*$")
-
-
-def _find_repo_root(start: Path) -> Path:
-    """Walk up until we find a .git directory or reach filesystem root."""
-    current = start.resolve()
-    while current != current.parent:
-        if (current / ".git").exists():
-            return current
-        current = current.parent
-    return Path.cwd()
-
-
-def _ensure_parent_dir(path: Path) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-
-
-def _write_file_if_missing(path: Path, content: str) -> None:
-    if path.exists():
-        raise FileExistsError(f"File already exists: {path}")
-    _ensure_parent_dir(path)
-    path.write_text(content, encoding="utf-8")
-
-
-def _mkdir_if_missing(path: Path) -> None:
-    if path.exists():
-        raise FileExistsError(f"Path already exists: {path}")
-    path.mkdir(parents=True, exist_ok=False)
-
-
-def _title_from_kebab(name: str) -> str:
-    return " ".join(part.capitalize() for part in name.split("-"))
+from typing import Final
+
+try:
+    from _common import (
+        ERROR,
+        OK,
+        emit,
+        find_repo_root,
+        title_from_kebab,
+        write_file_if_missing,
+    )
+    from _naming import validate_kebab
+except ModuleNotFoundError:
+    _SCRIPT_DIR = Path(__file__).resolve().parent
+    sys.path.insert(0, _SCRIPT_DIR.as_posix())
+    from _common import (
+        ERROR,
+        OK,
+        emit,
+        find_repo_root,
+        title_from_kebab,
+        write_file_if_missing,
+    )
+    from _naming import validate_kebab
+
+
+# Templates are pre-encoded around their variable slots so only the slot
+# values need encoding per call.
+_INSTRUCTION_HEAD: Final = (
+    b"---\n"
+    b"description: \"[TODO] Briefly describe the norms/standards enforced for files matched by applyTo.\"\n"
+    b"applyTo: \""
+)
+_INSTRUCTION_MID: Final = b"\"\n---\n\n# "
+_INSTRUCTION_TAIL: Final = (
+    b"\n\n"
+    b"## MUST\n\n"
+    b"- [TODO]\n\n"
+    b"## MUST NOT\n\n"
+    b"- [TODO]\n\n"
+    b"## Examples\n\n"
+    b"[TODO]\n"
+)
+
+_AGENT_HEAD: Final = b"---\ndescription: \"[TODO] When to choose the "
+_AGENT_MID: Final = b" agent and what it is responsible for.\"\n---\n\n# "
+_AGENT_TAIL: Final = (
+    b" Agent\n\n"
+    b"## When to use\n\n"
+    b"- [TODO]\n\n"
+    b"## What it does\n\n"
+    b"- [TODO]\n\n"
+    b"## Hard prohibitions\n\n"
+    b"- [TODO]\n\n"
+    b"## Links\n\n"
+    b"- [TODO] Link to relevant skills\n"
+)
+
+
+def _repo_root() -> Path:
+    return find_repo_root(Path.cwd()) or Path.cwd()
 
 
 def _validate_instruction_topic(topic: str) -> None:
-    if len(topic) < 1 or len(topic) > 64:
-        raise ValueError("topic must be 1..64 characters")
-    if not _INSTRUCTION_TOPIC_RE.fullmatch(topic):
-        raise ValueError("topic must be lower-kebab-case: a-z0-9 plus single hyphens")
+    validate_kebab(topic, "topic")
 
 
 def _validate_agent_role(role: str) -> None:
-    if len(role) < 1 or len(role) > 64:
-        raise ValueError("role must be 1..64 characters")
-    if not _AGENT_ROLE_RE.fullmatch(role):
-        raise ValueError("role must be lower-kebab-case: a-z0-9 plus single hyphens")
+    validate_kebab(role, "role")
 
 
 def init_instruction(instructions_root: Path, topic: str, apply_to: str) -> Path:
@@ -79,75 +97,69 @@ def init_instruction(instructions_root: Path, topic: str, apply_to: str) -> Path
     if not apply_to:
         raise ValueError("--apply-to is required")
 
-    instruction_path = instructions_root / f"{topic}.instructions.md"
-
-    content = (
-        "---\n"
-        "description: \"[TODO] Briefly describe the norms/standards enforced for files matched by applyTo.\"\n"
-        f"applyTo: \"{apply_to}\"\n"
-        "---\n\n"
-        f"# {_title_from_kebab(topic)}\n\n"
-        "## MUST\n\n"
-        "- [TODO]\n\n"
-        "## MUST NOT\n\n"
-        "- [TODO]\n\n"
-        "## Examples\n\n"
-        "[TODO]\n"
-    )
+    instruction_path = f"{instructions_root}/{topic}.instructions.md"
 
-    _write_file_if_missing(instruction_path, content)
-    return instruction_path
+    write_file_if_missing(
+        instruction_path,
+        _INSTRUCTION_HEAD,
+        apply_to.encode("utf-8"),
+        _INSTRUCTION_MID,
+        title_from_kebab(topic).encode("utf-8"),
+        _INSTRUCTION_TAIL,
+    )
+    return Path(instruction_path)
 
 
 def init_agent(agents_root: Path, role: str) -> Path:
     _validate_agent_role(role)
 
-    agent_path = agents_root / f"{role}.agent.md"
-
-    content = (
-        "---\n"
-        f"description: \"[TODO] When to choose the {role} agent and what it is responsible for.\"\n"
-        "---\n\n"
-        f"# {_title_from_kebab(role)} Agent\n\n"
-        "## When to use\n\n"
-        "- [TODO]\n\n"
-        "## What it does\n\n"
-        "- [TODO]\n\n"
-        "## Hard prohibitions\n\n"
-        "- [TODO]\n\n"
-        "## Links\n\n"
-        "- [TODO] Link to relevant skills\n"
-    )
+    agent_path = f"{agents_root}/{role}.agent.md"
 
-    _write_file_if_missing(agent_path, content)
-    return agent_path
+    write_file_if_missing(
+        agent_path,
+        _AGENT_HEAD,
+        role.encode("utf-8"),
+        _AGENT_MID,
+        title_from_kebab(role).encode("utf-8"),
+        _AGENT_TAIL,
+    )
+    return Path(agent_path)
 
 
 def main(argv: list[str]) -> int:
+    import argparse
+
     parser = argparse.ArgumentParser(
         prog="init_copilot_asset.py",
         description="Initialize Copilot-specific assets (instructions, agents)",
     )
     subparsers = parser.add_subparsers(dest="kind", required=True)
 
-    instr_p = subparsers.add_parser("instruction", help="Scaffold a new instruction")
-    instr_p.add_argument("topic", help="lower-kebab-case")
-    instr_p.add_argument("--apply-to", required=True, dest="apply_to", help="Glob for applyTo")
-    instr_p.add_argument(
-        "--instructions-dir",
-        dest="instructions_dir",
-        default=None,
-        help="Directory for instructions (default: .github/instructions from repo root)",
-    )
-
-    agent_p = subparsers.add_parser("agent", help="Scaffold a new agent")
-    agent_p.add_argument("role", help="lower-kebab-case")
-    agent_p.add_argument(
-        "--agents-dir",
-        dest="agents_dir",
-        default=None,
-        help="Directory for agents (default: .github/agents from repo root)",
-    )
+    # Only build the subparser this run needs; --help or an unknown kind
+    # gets all of them so argparse can list the choices.
+    kind = argv[0] if argv else None
+    build_all = kind not in ("instruction", "agent")
+
+    if build_all or kind == "instruction":
+        instr_p = subparsers.add_parser("instruction", help="Scaffold a new instruction")
+        instr_p.add_argument("topic", help="lower-kebab-case")
+        instr_p.add_argument("--apply-to", required=True, dest="apply_to", help="Glob for applyTo")
+        instr_p.add_argument(
+            "--instructions-dir",
+            dest="instructions_dir",
+            default=None,
+            help="Directory for instructions (default: .github/instructions from repo root)",
+        )
+
+    if build_all or kind == "agent":
+        agent_p = subparsers.add_parser("agent", help="Scaffold a new agent")
+        agent_p.add_argument("role", help="lower-kebab-case")
+        agent_p.add_argument(
+            "--agents-dir",
+            dest="agents_dir",
+            default=None,
+            help="Directory for agents (default: .github/agents from repo root)",
+        )
 
     args = parser.parse_args(argv)
 
@@ -158,11 +170,11 @@ def main(argv: list[str]) -> int:
                 if not instructions_root.is_absolute():
                     instructions_root = Path.cwd() / args.instructions_dir
             else:
-                repo_root = _find_repo_root(Path.cwd())
+                repo_root = _repo_root()
                 instructions_root = repo_root / ".github" / "instructions"
 
             created = init_instruction(instructions_root, args.topic, args.apply_to)
-            print(f"✅ Created instruction: {created}")
+            emit(sys.stdout, OK, f"Created instruction: {created}")
             return 0
 
         if args.kind == "agent":
@@ -171,16 +183,16 @@ def main(argv: list[str]) -> int:
                 if not agents_root.is_absolute():
                     agents_root = Path.cwd() / args.agents_dir
             else:
-                repo_root = _find_repo_root(Path.cwd())
+                repo_root = _repo_root()
                 agents_root = repo_root / ".github" / "agents"
 
             created = init_agent(agents_root, args.role)
-            print(f"✅ Created agent: {created}")
+            emit(sys.stdout, OK, f"Created agent: {created}")
             return 0
 
         raise RuntimeError(f"Unknown kind: {args.kind}")
     except Exception as exc:
-        print(f"❌ {exc}", file=sys.stderr)
+        emit(sys.stderr, ERROR, str(exc))
         return 1
 
 
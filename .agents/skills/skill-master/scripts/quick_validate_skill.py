@@ -18,68 +18,147 @@ Usage:
 
 from __future__ import annotations
 
-import re
+import os
+import stat
 import sys
+from dataclasses import dataclass
 from pathlib import Path
-
-
-# agentskills.io spec: lowercase alphanumeric + hyphens, no consecutive hyphens
-_NAME_RE = re.compile(r"^[a-z0-9]+(?:-[a-z0-9]+)*$")
+from typing import Final
+
+try:
+    from _common import ERROR, OK, emit
+    from _naming import validate_kebab
+except ModuleNotFoundError:
+    _SCRIPT_DIR = Path(__file__).resolve().parent
+    sys.path.insert(0, _SCRIPT_DIR.as_posix())
+    from _common import ERROR, OK, emit
+    from _naming import validate_kebab
+
+
+# Frontmatter is bounded by the spec's field limits (name <= 64,
+# description <= 1024, a few small optional fields), so it almost always
+# fits in the first read and never legitimately exceeds the hard cap.
+_HEAD_BYTES: Final = 4096
+_MAX_FRONTMATTER: Final = 8192
+
+
+def _normalize_newlines(data: bytes) -> bytes:
+    # Same translation read_text's universal newlines did: CRLF and lone CR
+    # both become LF. CR never occurs inside a UTF-8 multibyte sequence.
+    return data.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+
+
+def _read_frontmatter_text(path: Path) -> str:
+    """Read the start of SKILL.md, through the closing frontmatter fence."""
+    with open(path, "rb") as fh:
+        raw = fh.read(_HEAD_BYTES)
+        data = _normalize_newlines(raw)
+        end = data.find(b"\n---", 4)
+        if end == -1:
+            # Normalize the joined raw bytes, not the already-normalized head,
+            # so a CRLF split across the two reads stays one newline.
+            data = _normalize_newlines(raw + fh.read(_MAX_FRONTMATTER - _HEAD_BYTES))
+            end = data.find(b"\n---", 4)
+    if end == -1:
+        # No fence within the cap; _extract_frontmatter reports it. The read
+        # may have cut a multibyte character in half, so don't be strict.
+        return data.decode("utf-8", errors="replace")
+    return data[: end + 4].decode("utf-8")
 
 
 def _extract_frontmatter(text: str) -> str:
     if not text.startswith("---\n"):
         raise ValueError("No YAML frontmatter found (expected starting '---')")
 
-    end = text.find("\n---", 4)
+    end = text.find("\n---", 4, _MAX_FRONTMATTER)
     if end == -1:
-        raise ValueError("Invalid YAML frontmatter (missing closing '---')")
+        raise ValueError(
+            "Invalid or oversized YAML frontmatter "
+            f"(no closing '---' within {_MAX_FRONTMATTER} characters)"
+        )
 
     return text[4:end]
 
 
-def validate_skill_dir(skill_dir: Path) -> None:
-    skill_dir = skill_dir.resolve()
+def _field_value(lines: list[str], index: int, offset: int) -> str:
+    """Return the value of the ``key:`` line at lines[index].
+
+    A bare ``key:`` takes its value from the next non-blank line when that
+    line is indented (a plain YAML scalar continued on the next line, common
+    for long descriptions).
+    """
+    value = lines[index][offset:].strip()
+    if not value:
+        for following in lines[index + 1 :]:
+            if not following.strip():
+                continue
+            if following[:1] in (" ", "\t"):
+                value = following.strip()
+            break
+    return value.strip('"').strip("'")
+
+
+@dataclass(frozen=True)
+class SkillMeta:
+    """Frontmatter fields of a validated SKILL.md."""
+
+    # Hand-written rather than dataclass(slots=True), which needs Python 3.10.
+    __slots__ = ("name", "description")
+
+    name: str
+    description: str
+
 
-    if not skill_dir.exists():
-        raise FileNotFoundError(f"Skill directory not found: {skill_dir}")
+def validate_skill_dir(skill_dir: Path) -> SkillMeta:
+    """Validate skill_dir and return its parsed frontmatter."""
+    skill_dir = Path(os.path.abspath(skill_dir))
+    if os.path.islink(skill_dir):
+        skill_dir = skill_dir.resolve()
 
-    if not skill_dir.is_dir():
+    try:
+        dir_mode = os.stat(skill_dir).st_mode
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Skill directory not found: {skill_dir}") from None
+    if not stat.S_ISDIR(dir_mode):
         raise ValueError(f"Not a directory: {skill_dir}")
 
+    # The frontmatter name must equal the directory name, so a bad directory
+    # name fails validation regardless of SKILL.md; check it before any I/O.
+    validate_kebab(skill_dir.name, "skill directory name")
+
     skill_md = skill_dir / "SKILL.md"
-    if not skill_md.exists():
-        raise FileNotFoundError(f"SKILL.md not found: {skill_md}")
+    try:
+        md_size = os.stat(skill_md).st_size
+    except FileNotFoundError:
+        raise FileNotFoundError(f"SKILL.md not found: {skill_md}") from None
+    if md_size == 0:
+        raise ValueError(f"SKILL.md is empty: {skill_md}")
 
-    content = skill_md.read_text(encoding="utf-8")
+    content = _read_frontmatter_text(skill_md)
     frontmatter = _extract_frontmatter(content)
 
-    name_match = re.search(r"^name:\s*(.+)\s*$", frontmatter, re.MULTILINE)
-    if not name_match:
-        raise ValueError("Missing 'name:' in YAML frontmatter")
-
-    name = name_match.group(1).strip().strip('"').strip("'")
-
-    # agentskills.io spec: 1-64 characters
-    if len(name) < 1 or len(name) > 64:
-        raise ValueError(f"name must be 1-64 characters (got {len(name)})")
+    name: str | None = None
+    description: str | None = None
+    lines = frontmatter.split("\n")
+    for index, line in enumerate(lines):
+        if name is None and line.startswith("name:"):
+            name = _field_value(lines, index, 5)
+        elif description is None and line.startswith("description:"):
+            description = _field_value(lines, index, 12)
 
-    if not _NAME_RE.fullmatch(name):
-        raise ValueError(
-            "name must be lowercase a-z0-9 plus single hyphens (no --, no leading/trailing -)"
-        )
+    if name is None:
+        raise ValueError("Missing 'name:' in YAML frontmatter")
 
+    # The directory name already passed the agentskills.io naming rules,
+    # so matching it is enough to validate name.
     if name != skill_dir.name:
         raise ValueError(
             f"Frontmatter name '{name}' must match directory name '{skill_dir.name}'"
         )
 
-    desc_match = re.search(r"^description:\s*(.+)\s*$", frontmatter, re.MULTILINE)
-    if not desc_match:
+    if description is None:
         raise ValueError("Missing 'description:' in YAML frontmatter")
 
-    description = desc_match.group(1).strip().strip('"').strip("'")
-
     # agentskills.io spec: 1-1024 characters
     if len(description) < 1:
         raise ValueError("description must not be empty")
@@ -89,6 +168,8 @@ def validate_skill_dir(skill_dir: Path) -> None:
     if "<" in description or ">" in description:
         raise ValueError("description must not contain angle brackets (< or >)")
 
+    return SkillMeta(name=name, description=description)
+
 
 def main(argv: list[str]) -> int:
     if len(argv) != 1:
@@ -100,10 +181,10 @@ def main(argv: list[str]) -> int:
 
     try:
         validate_skill_dir(Path(argv[0]))
-        print("✅ Skill is valid")
+        emit(sys.stdout, OK, "Skill is valid")
         return 0
     except Exception as exc:
-        print(f"❌ {exc}", file=sys.stderr)
+        emit(sys.stderr, ERROR, str(exc))
         return 1
 
 
@@ -0,0 +1,59 @@
+"""Tests for scripts/quick_validate_skill.py.
+
+Run with: python -m unittest discover -s tests
+"""
+
+from __future__ import annotations
+
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+import quick_validate_skill  # noqa: E402
+from quick_validate_skill import validate_skill_dir  # noqa: E402
+
+
+class ValidateSkillDirTest(unittest.TestCase):
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.skill_dir = Path(tmp.name) / "my-skill"
+        self.skill_dir.mkdir()
+
+    def _write(self, content: bytes) -> None:
+        (self.skill_dir / "SKILL.md").write_bytes(content)
+
+    def test_inline_values(self) -> None:
+        self._write(b"---\nname: my-skill\ndescription: Does things.\n---\n# Body\n")
+        meta = validate_skill_dir(self.skill_dir)
+        self.assertEqual(meta.name, "my-skill")
+        self.assertEqual(meta.description, "Does things.")
+
+    def test_values_on_next_indented_line(self) -> None:
+        self._write(
+            b"---\nname:\n  my-skill\ndescription:\n  Long text on its own line.\n---\n"
+        )
+        meta = validate_skill_dir(self.skill_dir)
+        self.assertEqual(meta.name, "my-skill")
+        self.assertEqual(meta.description, "Long text on its own line.")
+
+    def test_bare_key_does_not_take_next_unindented_key(self) -> None:
+        self._write(b"---\nname: my-skill\ndescription:\nlicense: MIT\n---\n")
+        with self.assertRaisesRegex(ValueError, "description must not be empty"):
+            validate_skill_dir(self.skill_dir)
+
+    def test_crlf_split_across_first_read(self) -> None:
+        head = b"---\r\nname: my-skill\r\nx: "
+        # Put the CR of a CRLF at the last byte of the 4 KiB first read.
+        pad = b"b" * (4096 - len(head) - 1)
+        self._write(head + pad + b"\r\ndescription: hello\r\n---\r\n")
+        content = quick_validate_skill._read_frontmatter_text(self.skill_dir / "SKILL.md")
+        self.assertIn("bb\ndescription: hello", content)
+        self.assertEqual(validate_skill_dir(self.skill_dir).description, "hello")
+
+
+if __name__ == "__main__":
+    unittest.main()